@@ -1,7 +1,8 @@
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from livekit import api
@@ -13,6 +14,7 @@ from livekit.agents import (
     RoomInputOptions,
     metrics,
     JobContext,
+    JobProcess,
     WorkerOptions,
     function_tool,
     RunContext,
@@ -94,6 +96,16 @@ class KnowledgeBase:
         if self.collection.count() == 0:
             self._initialize_sample_data()
 
+        # Warm the query path (embedding model + HNSW index) so the first
+        # caller's tool call does not pay for it
+        try:
+            self.collection.query(query_texts=["warmup"], n_results=1)
+        except Exception as e:
+            logger.warning(f"Knowledge base warmup query failed: {e}")
+
+        # Cache recent searches; callers often repeat the same question
+        self._cached_query = lru_cache(maxsize=256)(self._query)
+
     def _initialize_sample_data(self):
         """Initialize the knowledge base with sample data."""
         sample_data = [
@@ -141,29 +153,51 @@ class KnowledgeBase:
     def search(self, query: str, n_results: int = 3) -> List[Dict[str, Any]]:
         """Search the knowledge base for relevant information."""
         try:
-            results = self.collection.query(query_texts=[query], n_results=n_results)
-
-            # Format results
-            formatted_results = []
-            if results["documents"] and results["documents"][0]:
-                for i, doc in enumerate(results["documents"][0]):
-                    formatted_results.append(
-                        {
-                            "text": doc,
-                            "metadata": results["metadatas"][0][i]
-                            if results["metadatas"]
-                            else {},
-                            "distance": results["distances"][0][i]
-                            if results["distances"]
-                            else 0,
-                        }
-                    )
-
-            return formatted_results
+            normalized_query = " ".join(query.lower().split())
+            results = self._cached_query(normalized_query, n_results)
+            # Copy out, including metadata, so callers can't mutate the cache
+            return [
+                {**result, "metadata": dict(result["metadata"])} for result in results
+            ]
         except Exception as e:
             logger.error(f"Error searching knowledge base: {e}")
             return []
 
+    def _query(self, query: str, n_results: int) -> Tuple[Dict[str, Any], ...]:
+        """Run a vector search and format the results (cached by search)."""
+        results = self.collection.query(query_texts=[query], n_results=n_results)
+
+        # Format results
+        formatted_results = []
+        if results["documents"] and results["documents"][0]:
+            for i, doc in enumerate(results["documents"][0]):
+                formatted_results.append(
+                    {
+                        "text": doc,
+                        "metadata": results["metadatas"][0][i]
+                        if results["metadatas"]
+                        else {},
+                        "distance": results["distances"][0][i]
+                        if results["distances"]
+                        else 0,
+                    }
+                )
+
+        return tuple(formatted_results)
+
+
+# Shared across calls handled by this worker process; loading the embedding
+# model and populating the collection is far too slow to do per call.
+_KB: Optional[KnowledgeBase] = None
+
+
+def get_kb() -> KnowledgeBase:
+    """Return the process-wide knowledge base, creating it on first use."""
+    global _KB
+    if _KB is None:
+        _KB = KnowledgeBase()
+    return _KB
+
 
 class Assistant(Agent):
     def __init__(self) -> None:
@@ -181,8 +215,8 @@ class Assistant(Agent):
         self.llm_start_time = None
         self.tts_start_time = None
 
-        # Initialize knowledge base
-        self.knowledge_base = KnowledgeBase()
+        # Shared knowledge base (built once per worker process)
+        self.knowledge_base = get_kb()
 
     @function_tool
     async def search_knowledge_base(
@@ -197,7 +231,7 @@ class Assistant(Agent):
             query: The search query to find relevant information in the knowledge base.
         """
         try:
-            logger.info(f"Searching knowledge base for: {query}")
+            logger.debug("Searching knowledge base for: %s", query)
             results = self.knowledge_base.search(query, n_results=2)
 
             if results:
@@ -230,6 +264,12 @@ class Assistant(Agent):
             }
 
 
+def prewarm(proc: JobProcess):
+    """Load shared resources once per worker process, before any call."""
+    proc.userdata["vad"] = silero.VAD.load()
+    get_kb()
+
+
 async def entrypoint(ctx: JobContext):
     # Setup LangFuse OpenTelemetry with metadata
     trace_provider = setup_langfuse(
@@ -250,7 +290,9 @@ async def entrypoint(ctx: JobContext):
     participant_identity = phone_number = None
 
     try:
-        dial_info = json.loads(ctx.job.metadata)
+        # Dispatches without metadata are common; skip the parse and the
+        # exception path for them
+        dial_info = json.loads(ctx.job.metadata) if ctx.job.metadata else {}
         participant_identity = phone_number = dial_info.get("phone_number")
         if not participant_identity:
             logger.warning(f"No phone_number found in metadata: {ctx.job.metadata}")
@@ -266,7 +308,7 @@ async def entrypoint(ctx: JobContext):
             llm="openai/gpt-4.1-mini",
             tts="cartesia/sonic-2:9626c31c-bec5-4cca-baa8-f8ba9e84c8bc",
             turn_detection=MultilingualModel(),
-            vad=silero.VAD.load(),
+            vad=ctx.proc.userdata["vad"],
             preemptive_generation=True,
         )
 
@@ -274,13 +316,18 @@ async def entrypoint(ctx: JobContext):
 
         @session.on("metrics_collected")
         def _on_metrics_collected(ev: MetricsCollectedEvent):
-            metrics.log_metrics(ev.metrics)
+            # Fires several times per turn; keep it off the hot path unless
+            # debugging. Usage is still collected and logged once per call.
+            if logger.isEnabledFor(logging.DEBUG):
+                metrics.log_metrics(ev.metrics)
             usage_collector.collect(ev.metrics)
 
         async def log_usage():
             summary = usage_collector.get_summary()
             logger.info(f"Usage: {summary}")
 
+        ctx.add_shutdown_callback(log_usage)
+
         @session.on("error")
         def on_error(ev: ErrorEvent):
             if ev.error.recoverable:
@@ -348,4 +395,13 @@ if __name__ == "__main__":
     # Run the agent using WorkerOptions pattern
     from livekit.agents.cli import cli
 
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, agent_name="outbound-caller"))
+    cli.run_app(
+        WorkerOptions(
+            entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
+            # prewarm builds the knowledge base; allow for a cold embedding
+            # model download when running outside the prebuilt image
+            initialize_process_timeout=60.0,
+            agent_name="outbound-caller",
+        )
+    )